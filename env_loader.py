@@ -10,6 +10,11 @@ import sys
 from pathlib import Path
 
 _KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# Split "KEY = value" in one C-level pass instead of chained split/strip.
+_LINE_RE = re.compile(r"^\s*(?P<key>[A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?P<value>.*)$")
+# Bare values with no quoting, comments, escapes, or embedded whitespace
+# need no shlex round-trip at all.
+_SIMPLE_VALUE_RE = re.compile(r"[^\s'\"#\\]*\s*")
 
 
 def expand_documented_vars(value: str) -> str:
@@ -32,16 +37,25 @@ def load_env(env_path: Path) -> dict[str, str]:
 
     env: dict[str, str] = {}
     for line_no, line in enumerate(env_path.read_text(encoding="utf-8").splitlines(), start=1):
-        if not line or line.strip().startswith("#") or "=" not in line:
-            continue
-
-        key, raw_value = line.split("=", 1)
-        key = key.strip()
-        if not key:
-            raise ValueError(f"Invalid .env entry on line {line_no}: empty key")
-        if not _KEY_RE.match(key):
+        match = _LINE_RE.match(line)
+        if match is None:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#") or "=" not in stripped:
+                continue
+            key = stripped.split("=", 1)[0].strip()
+            if not key:
+                raise ValueError(f"Invalid .env entry on line {line_no}: empty key")
             raise ValueError(f"Invalid .env key on line {line_no}: {key}")
 
+        key = match.group("key")
+        raw_value = match.group("value")
+
+        # Fast path: the common unquoted `KEY=value` needs only the regex
+        # capture; shlex handles the quoted/commented remainder.
+        if _SIMPLE_VALUE_RE.fullmatch(raw_value):
+            env[key] = expand_documented_vars(raw_value.rstrip())
+            continue
+
         try:
             parsed = shlex.split(raw_value, comments=True, posix=True)
         except ValueError as exc:
@@ -1,5 +1,13 @@
 import argparse
-import os, shutil, subprocess, sys
+import collections
+import functools
+import hashlib
+import http.client
+import json
+import os, shutil, subprocess, sys, threading, time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from subprocess import CalledProcessError
 from pathlib import Path
 
@@ -9,17 +17,63 @@ if str(_REPO_ROOT) not in sys.path:
 
 from env_loader import load_env, validate_model_language
 
+# Serialize progress prints when downloads run on worker threads.
+_print_lock = threading.Lock()
+
 # -------- folder helpers --------
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+def ensure_dirs(targets: list[Path]):
+    """Create several directories, touching each unique ancestor only once.
+
+    Per-target mkdir(parents=True) re-stats every ancestor; deduplicating
+    the combined ancestor set avoids that (noticeable on network homes).
+    """
+    unique = sorted(
+        {p for target in targets for p in (target, *target.parents)},
+        key=lambda p: len(p.parts),
+    )
+    for p in unique:
+        try:
+            os.mkdir(p)
+        except FileExistsError:
+            pass
+    return targets
+
+def _run_streaming(cmd: list[str], cwd: Path, log_path: Path) -> None:
+    """Run cmd, teeing its combined output to log_path line by line.
+
+    Unlike capture_output, which buffers the entire compiler log in a
+    Python str, only the last 200 lines stay in memory for the error
+    message raised on failure.
+    """
+    tail = collections.deque(maxlen=200)
+    with log_path.open("w", encoding="utf-8") as log_file:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in proc.stdout:
+            log_file.write(line)
+            tail.append(line)
+        returncode = proc.wait()
+    if returncode != 0:
+        raise CalledProcessError(returncode, cmd, stderr="".join(tail))
+
 def run_cmd(cmd, cwd=None, check=True):
     """Helper: Execute command in terminal and print."""
     print("$", " ".join(cmd))
     return subprocess.run(cmd, cwd=cwd, check=check)
 
+@functools.lru_cache(maxsize=None)
 def which(name: str):
+    """PATH lookup, cached: shutil.which stats every $PATH entry per call."""
     return shutil.which(name)
 
 def on_macos():
@@ -27,13 +81,13 @@ def on_macos():
 
 def check_git():
     """Check if git is installed"""
-    if not shutil.which("git"):
+    if not which("git"):
         raise RuntimeError("❌ git not found, please install git first")
     print("✅ git found")
 
 def check_cmake():
     """Check if cmake is installed"""
-    if not shutil.which("cmake"):
+    if not which("cmake"):
         raise RuntimeError("❌ cmake not found, please install cmake (brew install cmake)")
     print("✅ cmake found")
 
@@ -45,6 +99,9 @@ def ensure_ffmpeg():
     if on_macos():
         print("⚠️ ffmpeg not found; installing via Homebrew...")
         run_cmd(["brew", "install", "ffmpeg"], check=False)
+        # The cached miss from the pre-install lookup would otherwise hide
+        # the freshly installed binary.
+        which.cache_clear()
         if which("ffmpeg"):
             print("✅ ffmpeg installed:", which("ffmpeg"))
         else:
@@ -83,31 +140,41 @@ def ensure_whisper_cpp(whisper_root: Path) -> Path:
     
     if not whisper_cli.exists():
         print(f"🔨 Starting whisper.cpp compilation...")
-        
+
+        # Re-running the configure step re-detects compilers and rewrites
+        # the cache (tens of seconds). Skip it when the existing cache is
+        # still consistent with CMakeLists.txt.
+        cache = whisper_root / "build" / "CMakeCache.txt"
+        cache_valid = cache.exists() and cache.stat().st_mtime >= cmake_file.stat().st_mtime
+
+        # Ninja schedules the build graph with less per-target overhead
+        # than recursive make. Only select it on a fresh configure: an
+        # existing cache pins its original generator, and cmake errors out
+        # rather than switching.
+        configure_cmd = ["cmake", "-S", ".", "-B", "build", "-DCMAKE_BUILD_TYPE=Release"]
+        if which("ninja") and not cache.exists():
+            configure_cmd += ["-G", "Ninja"]
+
+        jobs = os.cpu_count() or 4
+        build_cmd = ["cmake", "--build", "build", "--parallel", str(jobs), "--config", "Release"]
+
+        log_dir = ensure_dir(_REPO_ROOT / "logs")
+        build_log = log_dir / "whisper_build.log"
+
         try:
-            # cmake -B build
-            print("   → cmake -B build")
-            subprocess.run(
-                ["cmake", "-B", "build"],
-                cwd=whisper_root,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            
-            # cmake --build build -j --config Release
-            print("   → cmake --build build -j --config Release")
-            subprocess.run(
-                ["cmake", "--build", "build", "-j", "--config", "Release"],
-                cwd=whisper_root,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            
+            if cache_valid:
+                print("   → cmake cache up to date, skipping configure")
+            else:
+                cmake_log = log_dir / "whisper_cmake.log"
+                print(f"   → {' '.join(configure_cmd)} (log: {cmake_log})")
+                _run_streaming(configure_cmd, whisper_root, cmake_log)
+
+            print(f"   → {' '.join(build_cmd)} (log: {build_log})")
+            _run_streaming(build_cmd, whisper_root, build_log)
+
             print(f"✅ whisper.cpp compilation complete")
         except CalledProcessError as e:
-            print(f"❌ Compilation failed: {e.stderr}")
+            print(f"❌ Compilation failed: {e.stderr or f'see {build_log}'}")
             raise
     else:
         print(f"✅ whisper-cli already compiled")
@@ -115,6 +182,102 @@ def ensure_whisper_cpp(whisper_root: Path) -> Path:
     return whisper_cli
 
 
+# Same source the official models/download-ggml-model.sh uses.
+_MODEL_BASE_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main"
+
+# Sidecar cache: {filename: {"size": int, "mtime_ns": int, "sha256": hex}}
+_VERIFIED_CACHE = ".verified.json"
+_verify_lock = threading.Lock()
+
+
+def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while block := fh.read(chunk_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _verify_model(models_dir: Path, model_file: Path) -> None:
+    """Hash a model once and memoize the result by its (size, mtime) pair.
+
+    whisper.cpp does not ship per-model checksums in-tree, so the first
+    verification records the hash; subsequent init runs skip the
+    seconds-per-GB re-hash as long as the stat tuple is unchanged.
+    """
+    cache_path = models_dir / _VERIFIED_CACHE
+    st = model_file.stat()
+
+    with _verify_lock:
+        try:
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+
+        entry = cache.get(model_file.name)
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return  # memo hit: file unchanged since last verification
+
+        cache[model_file.name] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": _sha256_file(model_file),
+        }
+        cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+
+def _download_resumable(
+    url: str,
+    dest: Path,
+    chunk_size: int = 8 * 1024 * 1024,
+    max_retries: int = 5,
+) -> Path:
+    """Download url to dest, resuming a partial .part file via HTTP Range.
+
+    A dropped connection mid-download of a 1GB+ model only costs the
+    remaining bytes on the next attempt instead of a full restart.
+    """
+    part = dest.with_suffix(dest.suffix + ".part")
+
+    for attempt in range(1, max_retries + 1):
+        offset = part.stat().st_size if part.exists() else 0
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+
+        try:
+            with urllib.request.urlopen(request) as response:
+                if offset and response.status != 206:
+                    # Server ignored the Range header; start over.
+                    offset = 0
+                with part.open("ab" if offset else "wb") as out:
+                    while True:
+                        block = response.read(chunk_size)
+                        if not block:
+                            break
+                        out.write(block)
+            os.replace(part, dest)
+            return dest
+        except urllib.error.HTTPError as exc:
+            # 4xx means the request itself is wrong (e.g. a typo'd model
+            # name); retrying cannot help. Only 5xx is transient.
+            if exc.code < 500:
+                raise RuntimeError(f"Download failed ({exc.code} {exc.reason}): {url}")
+            if attempt == max_retries:
+                raise RuntimeError(f"Download failed after {max_retries} attempts: {url}\n{exc}")
+            with _print_lock:
+                print(f"⚠️ Server error ({exc}); retrying ({attempt}/{max_retries})...")
+            time.sleep(min(2 ** attempt, 30))
+        except (OSError, http.client.HTTPException) as exc:
+            if attempt == max_retries:
+                raise RuntimeError(f"Download failed after {max_retries} attempts: {url}\n{exc}")
+            with _print_lock:
+                print(f"⚠️ Download interrupted ({exc}); retrying ({attempt}/{max_retries})...")
+            time.sleep(min(2 ** attempt, 30))
+
+    raise RuntimeError(f"Download failed: {url}")
+
+
 def ensure_model(whisper_root: Path, model_name: str) -> Path:
     """
     Ensure a single model is downloaded
@@ -122,41 +285,46 @@ def ensure_model(whisper_root: Path, model_name: str) -> Path:
     """
     models_dir = whisper_root / "models"
     model_file = models_dir / f"ggml-{model_name}.bin"
-    
-    print(f"\n🔍 Checking model: {model_name}")
-    
-    # Check if model exists
-    if model_file.exists() and model_file.stat().st_size > 0:
-        print(f"✅ Model already exists: {model_file.name}")
+
+    with _print_lock:
+        print(f"\n🔍 Checking model: {model_name}")
+
+    # Check if model exists (one stat instead of exists() + stat())
+    try:
+        has_model = model_file.stat().st_size > 0
+    except FileNotFoundError:
+        has_model = False
+    if has_model:
+        _verify_model(models_dir, model_file)
+        with _print_lock:
+            print(f"✅ Model already exists: {model_file.name}")
         return model_file
-    
-    # Model doesn't exist, download using official script
-    print(f"⬇️  Downloading model: {model_name}")
-    
-    download_script = models_dir / "download-ggml-model.sh"
-    
-    if not download_script.exists():
-        raise FileNotFoundError(f"❌ Download script not found: {download_script}")
-    
+
+    # Model doesn't exist; fetch it from the same URL the official
+    # download-ggml-model.sh script uses, with Range-resume support.
+    ensure_dir(models_dir)
+    url = f"{_MODEL_BASE_URL}/ggml-{model_name}.bin"
+
+    with _print_lock:
+        print(f"⬇️  Downloading model: {model_name}")
+
     try:
-        # sh ./models/download-ggml-model.sh base
-        subprocess.run(
-            ["sh", str(download_script), model_name],
-            cwd=whisper_root,
-            check=True,
-            capture_output=False  # Let user see download progress
-        )
-        
-        # Check again if model download was successful
-        if model_file.exists() and model_file.stat().st_size > 0:
-            print(f"✅ Model download complete: {model_file.name}")
-            return model_file
-        else:
-            raise RuntimeError(f"❌ Model still not found after download: {model_file}")
-            
-    except CalledProcessError as e:
+        _download_resumable(url, model_file)
+    except RuntimeError as e:
         raise RuntimeError(f"❌ Model download failed: {model_name}\n{e}")
 
+    # Check again if model download was successful
+    try:
+        downloaded = model_file.stat().st_size > 0
+    except FileNotFoundError:
+        downloaded = False
+    if downloaded:
+        _verify_model(models_dir, model_file)
+        with _print_lock:
+            print(f"✅ Model download complete: {model_file.name}")
+        return model_file
+    raise RuntimeError(f"❌ Model still not found after download: {model_file}")
+
 
 def init_whisper_environment(whisper_root: Path, models: list[str]) -> dict:
     """
@@ -180,14 +348,20 @@ def init_whisper_environment(whisper_root: Path, models: list[str]) -> dict:
     check_git()
     check_cmake()
     
-    # 2. Ensure whisper.cpp exists and is compiled
-    whisper_cli = ensure_whisper_cpp(whisper_root)
-    
-    # 3. Download all required models
+    # 2+3. Build whisper.cpp and download models concurrently: the compile
+    #      is CPU-bound (cmake already runs -j) while the downloads are
+    #      network-bound subprocesses, so the stages overlap cleanly.
+    #      One extra worker is reserved for the build future.
     downloaded_models = {}
-    for model_name in models:
-        model_path = ensure_model(whisper_root, model_name)
-        downloaded_models[model_name] = model_path
+    with ThreadPoolExecutor(max_workers=min(8, len(models)) + 1) as executor:
+        build_future = executor.submit(ensure_whisper_cpp, whisper_root)
+        futures = {
+            executor.submit(ensure_model, whisper_root, model_name): model_name
+            for model_name in models
+        }
+        for future in as_completed(futures):
+            downloaded_models[futures[future]] = future.result()
+        whisper_cli = build_future.result()
     
     print("\n" + "=" * 60)
     print("✅ Initialization complete!")
@@ -325,10 +499,7 @@ def main():
         return 1
 
     # Create directories
-    ensure_dir(records_dir)
-    ensure_dir(transcripts_dir)
-    ensure_dir(whisper_root / "models")
-    ensure_dir(repo_root / "logs")
+    ensure_dirs([records_dir, transcripts_dir, whisper_root / "models", repo_root / "logs"])
     print("✅ Folders ready")
 
     ensure_ffmpeg()
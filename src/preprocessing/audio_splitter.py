@@ -3,13 +3,18 @@
 # Split audio files at silence points for better mixed-language transcription
 
 from __future__ import annotations
+import asyncio
+import bisect
+import functools
 import os
+import re
 import sys
 import json
 import argparse
 import subprocess
+import wave
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, NamedTuple, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 
 try:
@@ -18,16 +23,68 @@ try:
 except Exception:
     pass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # optional; pure-Python fallbacks are used without it
+
+try:
+    import av
+except ImportError:
+    av = None  # optional; subprocess ffmpeg paths are used without it
+
+try:
+    import numba
+except ImportError:
+    numba = None  # optional; the NumPy window scan is used without it
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional; stdlib json is used without it
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SilenceSegment:
     """Represents a detected silence period"""
     start: float  # seconds
     end: float    # seconds
-    duration: float  # seconds
+
+    @property
+    def duration(self) -> float:
+        """Length in seconds (derived, not stored)"""
+        return self.end - self.start
+
+
+def _as_float_array(values: List[float]) -> Sequence[float]:
+    """Pack floats into a float64 ndarray when NumPy is available"""
+    return np.asarray(values, dtype=np.float64) if np is not None else values
 
 
-@dataclass
+class Silences(NamedTuple):
+    """
+    Detected silences as two parallel start/end arrays (SoA layout)
+
+    Thousands of boxed SilenceSegment instances are cache-hostile;
+    two packed arrays keep the vectorized consumers fast and cut
+    per-silence memory from ~200B to 16B.
+    """
+    start: Sequence[float]
+    end: Sequence[float]
+
+    @classmethod
+    def from_segments(cls, segments: List[SilenceSegment]) -> "Silences":
+        return cls(
+            _as_float_array([s.start for s in segments]),
+            _as_float_array([s.end for s in segments]),
+        )
+
+    def segments(self) -> List[SilenceSegment]:
+        """Itemwise view for callers that want one record per silence"""
+        return [SilenceSegment(s, e) for s, e in zip(self.start, self.end)]
+
+
+@dataclass(slots=True, frozen=True)
 class AudioSegment:
     """Represents a split audio segment"""
     filename: str
@@ -37,34 +94,224 @@ class AudioSegment:
     segment_index: int
 
 
+# One C-level scan per silencedetect line instead of chained split/strip
+_SILENCE_RE = re.compile(r"silence_(start|end):\s*(-?[\d.]+)")
+
+# ffmpeg threads per invocation; 0 lets ffmpeg saturate the machine.
+# The parallel extraction fallback passes an explicit per-worker count
+# instead so N workers don't oversubscribe the cores.
+FFMPEG_THREADS = 0
+
+
+def _parse_silence_lines(lines) -> Silences:
+    """Parse silencedetect stderr lines into parallel start/end arrays
+
+    No per-line pairing state: each match appends to its own array and
+    the two arrays are reconciled once at the end, halving the branches
+    taken per line.
+    """
+    starts: List[float] = []
+    ends: List[float] = []
+
+    for line in lines:
+        if 'silencedetect' not in line:
+            continue
+        match = _SILENCE_RE.search(line)
+        if match:
+            (starts if match.group(1) == 'start' else ends).append(float(match.group(2)))
+
+    # ffmpeg alternates start/end events; drop an unmatched leading end
+    # (stream began mid-silence) and truncate an unmatched trailing start
+    if ends and (not starts or ends[0] < starts[0]):
+        ends.pop(0)
+    count = min(len(starts), len(ends))
+
+    return Silences(_as_float_array(starts[:count]), _as_float_array(ends[:count]))
+
+
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
-    """Check if ffmpeg is available"""
+    """Check if ffmpeg is available (probed once per process)
+
+    A successful probe is advertised through FFMPEG_OK so spawned
+    children skip their own verification subprocess.
+    """
+    if os.environ.get("FFMPEG_OK") == "1":
+        return True
     try:
-        subprocess.run(["ffmpeg", "-version"], 
+        subprocess.run(["ffmpeg", "-version"],
                       capture_output=True, check=True)
+        os.environ["FFMPEG_OK"] = "1"
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _window_mean_square(samples, win):
+        """Per-window mean of squared int16 samples, one fused pass.
+
+        Avoids the float32 copy and intermediate square array the NumPy
+        version allocates; LLVM vectorizes the inner loop and prange
+        spreads windows across cores.
+        """
+        n_windows = samples.shape[0] // win
+        out = np.empty(n_windows, dtype=np.float32)
+        for w in numba.prange(n_windows):
+            acc = 0.0
+            base = w * win
+            for i in range(win):
+                value = np.float32(samples[base + i])
+                acc += value * value
+            out[w] = acc / win
+        return out
+
+
+def _wav_data_offset(fh) -> Tuple[int, int]:
+    """Walk the RIFF chunks and return (offset, size) of the data payload"""
+    header = fh.read(12)
+    if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+        raise ValueError("not a RIFF/WAVE file")
+    while True:
+        chunk = fh.read(8)
+        if len(chunk) < 8:
+            raise ValueError("no data chunk found")
+        name, size = chunk[:4], int.from_bytes(chunk[4:8], 'little')
+        if name == b'data':
+            return fh.tell(), size
+        fh.seek(size + (size & 1), 1)  # chunks are word-aligned
+
+
+def _detect_silences_wav(
+    audio_file: Path,
+    noise_threshold_db: float,
+    min_silence_duration: float
+) -> Silences:
+    """
+    Silence scan over memory-mapped PCM samples in NumPy
+
+    For the common 16-bit WAV input, one vectorized pass over 20ms
+    window RMS values replaces the whole ffmpeg decode: memory-bound,
+    no subprocess, and the silent-window runs fall out of a diff over
+    the boolean mask.
+    """
+    with wave.open(str(audio_file), 'rb') as wav:
+        n_channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        sample_rate = wav.getframerate()
+    if sample_width != 2:
+        raise ValueError(f"unsupported sample width: {sample_width}")
+
+    with audio_file.open('rb') as fh:
+        offset, size = _wav_data_offset(fh)
+
+    count = size // 2
+    if count == 0:
+        return Silences(_as_float_array([]), _as_float_array([]))
+    samples = np.memmap(str(audio_file), dtype='<i2', mode='r', offset=offset, shape=(count,))
+
+    # 20ms windows across all interleaved channels
+    win = max(1, int(sample_rate * 0.02)) * n_channels
+    usable = (count // win) * win
+    if usable == 0:
+        return Silences(_as_float_array([]), _as_float_array([]))
+
+    if numba is not None:
+        mean_square = _window_mean_square(np.asarray(samples[:usable]), win)
+    else:
+        squares = np.square(samples[:usable].astype(np.float32))
+        mean_square = squares.reshape(-1, win).mean(axis=1)
+    rms = np.sqrt(mean_square) / 32768.0
+    silent = rms < 10.0 ** (noise_threshold_db / 20.0)
+
+    # Coalesce consecutive silent windows into runs
+    edges = np.diff(silent.astype(np.int8))
+    run_starts = np.flatnonzero(edges == 1) + 1
+    run_ends = np.flatnonzero(edges == -1) + 1
+    if silent[0]:
+        run_starts = np.insert(run_starts, 0, 0)
+    if silent[-1]:
+        run_ends = np.append(run_ends, len(silent))
+
+    window_seconds = win / n_channels / sample_rate
+    starts = run_starts * window_seconds
+    ends = run_ends * window_seconds
+    keep = (ends - starts) >= min_silence_duration
+    return Silences(starts[keep], ends[keep])
+
+
+def _detect_silences_av(
+    audio_file: Path,
+    noise_threshold_db: float,
+    min_silence_duration: float
+) -> Silences:
+    """
+    Detect silences in-process by decoding frames with PyAV
+
+    Avoids the ~30-80ms ffmpeg startup per invocation and keeps the
+    decoder warm in this process. Per-frame RMS is thresholded against
+    the same dB level silencedetect would use.
+    """
+    threshold = 10.0 ** (noise_threshold_db / 20.0)
+    starts: List[float] = []
+    ends: List[float] = []
+    silence_start = None
+    clock = 0.0
+
+    with av.open(str(audio_file)) as container:
+        if not container.streams.audio:
+            raise ValueError(f"No audio stream in {audio_file}")
+        stream = container.streams.audio[0]
+        for frame in container.decode(stream):
+            if frame.pts is not None and frame.time_base is not None:
+                clock = float(frame.pts * frame.time_base)
+
+            samples = frame.to_ndarray()
+            if samples.dtype.kind in 'iu':
+                samples = samples.astype(np.float32) / float(np.iinfo(samples.dtype).max)
+            rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+
+            if rms < threshold:
+                if silence_start is None:
+                    silence_start = clock
+            else:
+                if silence_start is not None and clock - silence_start >= min_silence_duration:
+                    starts.append(silence_start)
+                    ends.append(clock)
+                silence_start = None
+
+            clock += frame.samples / float(frame.sample_rate)
+
+        if silence_start is not None and clock - silence_start >= min_silence_duration:
+            starts.append(silence_start)
+            ends.append(clock)
+
+    return Silences(_as_float_array(starts), _as_float_array(ends))
+
+
 def detect_silences(
     audio_file: Path,
     noise_threshold_db: float = -45.0,
     min_silence_duration: float = 1.0
-) -> List[SilenceSegment]:
+) -> Silences:
     """
     Detect silence segments in audio file using ffmpeg silencedetect
-    
+
     Args:
         audio_file: Path to input audio file
         noise_threshold_db: Anything quieter than this is silence (e.g., -40 to -50)
         min_silence_duration: Minimum silence duration in seconds to detect
-    
+
     Returns:
-        List of SilenceSegment objects
+        Silences with parallel start/end arrays
     """
+    # silencedetect reports at -loglevel info, so only the banner and the
+    # per-frame progress stats can be suppressed here
     cmd = [
         "ffmpeg",
+        "-hide_banner", "-nostats",
+        "-threads", str(FFMPEG_THREADS),
         "-i", str(audio_file),
         "-af", f"silencedetect=noise={noise_threshold_db}dB:d={min_silence_duration}",
         "-f", "null",
@@ -72,75 +319,95 @@ def detect_silences(
     ]
     
     print(f"[INFO] Detecting silences (threshold: {noise_threshold_db}dB, min: {min_silence_duration}s)...")
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    # Parse ffmpeg stderr output
-    silences = []
-    silence_start = None
-    
-    for line in result.stderr.split('\n'):
-        if 'silencedetect' in line:
-            if 'silence_start' in line:
-                # Extract start time
-                parts = line.split('silence_start:')
-                if len(parts) > 1:
-                    silence_start = float(parts[1].strip().split()[0])
-            
-            elif 'silence_end' in line and silence_start is not None:
-                # Extract end time and duration
-                parts = line.split('silence_end:')
-                if len(parts) > 1:
-                    end_part = parts[1].strip().split('|')
-                    silence_end = float(end_part[0].strip().split()[0])
-                    
-                    # Duration might be in the line
-                    duration = silence_end - silence_start
-                    
-                    silences.append(SilenceSegment(
-                        start=silence_start,
-                        end=silence_end,
-                        duration=duration
-                    ))
-                    silence_start = None
-    
-    print(f"[INFO] Found {len(silences)} silence periods")
+
+    # Fast path for PCM WAV: scan the memory-mapped samples directly
+    if np is not None and audio_file.suffix.lower() == '.wav':
+        try:
+            silences = _detect_silences_wav(audio_file, noise_threshold_db, min_silence_duration)
+            print(f"[INFO] Found {len(silences.start)} silence periods")
+            return silences
+        except (ValueError, OSError, wave.Error, EOFError) as e:
+            print(f"[WARN] WAV fast-path scan failed ({e}); falling back")
+
+    # In-process decode when PyAV (and its NumPy dependency) is available;
+    # otherwise spawn ffmpeg and parse silencedetect output
+    if av is not None and np is not None:
+        try:
+            silences = _detect_silences_av(audio_file, noise_threshold_db, min_silence_duration)
+            print(f"[INFO] Found {len(silences.start)} silence periods")
+            return silences
+        except (av.FFmpegError, OSError, ValueError) as e:
+            print(f"[WARN] PyAV silence scan failed ({e}); falling back to ffmpeg")
+
+    # Stream stderr and parse as lines arrive instead of buffering the
+    # whole decode log (tens of MB for hour-long inputs) before parsing
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+
+    silences = _parse_silence_lines(proc.stderr)
+    proc.wait()
+
+    print(f"[INFO] Found {len(silences.start)} silence periods")
     return silences
 
 
-def get_audio_duration(audio_file: Path) -> float:
-    """Get total duration of audio file in seconds"""
+@functools.lru_cache(maxsize=128)
+def _duration_cached(path: str, size: int, mtime_ns: int) -> float:
+    """Probe the file's duration; size/mtime_ns exist only to key the cache"""
+    if av is not None:
+        try:
+            with av.open(path) as container:
+                if container.duration is not None:
+                    return container.duration / av.time_base
+        except (av.FFmpegError, OSError):
+            pass  # fall through to ffprobe
+
     cmd = [
         "ffprobe",
         "-v", "error",
         "-show_entries", "format=duration",
         "-of", "default=noprint_wrappers=1:nokey=1",
-        str(audio_file)
+        path
     ]
-    
+
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)
     return float(result.stdout.strip())
 
 
+def get_audio_duration(audio_file: Path) -> float:
+    """Get total duration of audio file in seconds
+
+    Memoized on (path, size, mtime): re-processing an unchanged file
+    skips the ffprobe spawn entirely.
+    """
+    st = audio_file.stat()
+    return _duration_cached(str(audio_file), st.st_size, st.st_mtime_ns)
+
+
 def calculate_split_points(
-    silences: List[SilenceSegment],
+    silences: Silences,
     total_duration: float,
     min_segment_length: float = 30.0,
     max_segment_length: float = 120.0
 ) -> List[Tuple[float, float]]:
     """
     Calculate optimal split points based on silence detection
-    
+
     Args:
-        silences: List of detected silences
+        silences: Detected silences (parallel start/end arrays)
         total_duration: Total audio duration in seconds
         min_segment_length: Minimum segment length (too short = bad context)
         max_segment_length: Maximum segment length (too long = mixed languages)
-    
+
     Returns:
         List of (start_time, end_time) tuples in seconds
     """
-    if not silences:
+    if len(silences.start) == 0:
         # No silences found, split by max_segment_length
         print("[WARN] No silences detected, splitting by time only")
         segments = []
@@ -151,99 +418,266 @@ def calculate_split_points(
             current = end
         return segments
     
+    # Silence midpoints arrive sorted, so the greedy scan can binary-search
+    # straight to the first midpoint min_segment_length past the current
+    # split instead of walking every silence in Python
+    if np is not None:
+        mids = (np.asarray(silences.start) + np.asarray(silences.end)) * 0.5
+    else:
+        mids = [(s + e) / 2.0 for s, e in zip(silences.start, silences.end)]
+
     segments = []
     current_start = 0.0
-    
-    for silence in silences:
-        # Use middle of silence as split point
-        split_point = (silence.start + silence.end) / 2.0
-        segment_duration = split_point - current_start
-        
-        # Only split if we've accumulated enough content
-        if segment_duration >= min_segment_length:
-            segments.append((current_start, split_point))
-            current_start = split_point
-        
-        # Force split if segment would be too long
-        elif segment_duration >= max_segment_length:
-            segments.append((current_start, split_point))
-            current_start = split_point
-    
+    count = len(mids)
+    index = 0
+
+    while index < count:
+        target = current_start + min_segment_length
+        if np is not None:
+            index = int(np.searchsorted(mids, target))
+        else:
+            index = bisect.bisect_left(mids, target, index)
+        if index >= count:
+            break
+        split_point = float(mids[index])
+        segments.append((current_start, split_point))
+        current_start = split_point
+        index += 1
+
     # Add final segment
     if current_start < total_duration:
         segments.append((current_start, total_duration))
-    
+
     return segments
 
 
 def calculate_segment_silence_ratio(
-    audio_file: Path,
+    silences: Silences,
     start_time: float,
-    duration: float,
-    noise_threshold_db: float = -45.0
+    duration: float
 ) -> float:
     """
     Calculate what percentage of a segment is silence
     Used to filter out segments that are almost entirely silent
+
+    Intersects the silences already parsed by detect_silences with the
+    segment window instead of re-decoding the segment with another
+    ffmpeg pass per split point.
     """
-    cmd = [
+    if duration <= 0:
+        return 0.0
+
+    end_time = start_time + duration
+    if np is not None:
+        overlap = np.minimum(np.asarray(silences.end), end_time) \
+            - np.maximum(np.asarray(silences.start), start_time)
+        total_silence = float(np.clip(overlap, 0.0, None).sum())
+    else:
+        total_silence = sum(
+            max(0.0, min(end, end_time) - max(start, start_time))
+            for start, end in zip(silences.start, silences.end)
+        )
+    return total_silence / duration
+
+
+# Compressed inputs whose copy-cuts snap to packet boundaries and can
+# drop audio at the edges; worth a cheap PCM re-encode if copy fails
+_LOSSY_SUFFIXES = {'.mp3', '.m4a', '.aac', '.opus', '.ogg'}
+
+
+def _split_segment_cmds(
+    input_file: Path,
+    output_file: Path,
+    start_time: float,
+    duration: float,
+    threads: Optional[int] = None
+) -> Tuple[List[str], Optional[List[str]]]:
+    """
+    Build the (copy_cmd, fallback_encode_cmd) pair for one segment cut
+
+    Seeks on the input side (-ss before -i), which jumps via the index
+    instead of decoding everything before start_time. The fallback
+    re-encode command is None for inputs where stream copy is exact.
+    """
+    if threads is None:
+        threads = FFMPEG_THREADS
+    base_cmd = [
         "ffmpeg",
+        "-hide_banner", "-nostats", "-loglevel", "error",
+        "-threads", str(threads),
         "-ss", str(start_time),
+        "-i", str(input_file),
         "-t", str(duration),
-        "-i", str(audio_file),
-        "-af", f"silencedetect=noise={noise_threshold_db}dB:d=0.1",
-        "-f", "null",
-        "-"
     ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    total_silence = 0.0
-    for line in result.stderr.split('\n'):
-        if 'silencedetect' in line and 'silence_duration' in line:
-            parts = line.split('silence_duration:')
-            if len(parts) > 1:
-                total_silence += float(parts[1].strip().split()[0])
-    
-    return total_silence / duration if duration > 0 else 0.0
+    copy_cmd = base_cmd + [
+        "-c", "copy",  # Copy codec (fast, no re-encoding)
+        "-avoid_negative_ts", "make_zero",
+        "-y",  # Overwrite output
+        str(output_file)
+    ]
+
+    encode_cmd = None
+    if input_file.suffix.lower() in _LOSSY_SUFFIXES:
+        # Stream copy on lossy inputs can drop audio at packet edges;
+        # keep a cheap PCM re-encode ready as plan B
+        encode_cmd = base_cmd + ["-c:a", "pcm_s16le", "-y", str(output_file)]
+
+    return copy_cmd, encode_cmd
 
 
 def split_audio_segment(
     input_file: Path,
     output_file: Path,
     start_time: float,
-    duration: float
+    duration: float,
+    threads: Optional[int] = None
 ) -> bool:
     """
     Extract a segment from audio file using ffmpeg
-    
+
     Args:
         input_file: Source audio file
         output_file: Output segment file
         start_time: Start time in seconds
         duration: Duration in seconds
-    
+        threads: ffmpeg thread count (default: module FFMPEG_THREADS)
+
     Returns:
         True if successful
     """
+    copy_cmd, encode_cmd = _split_segment_cmds(
+        input_file, output_file, start_time, duration, threads
+    )
+
+    last_error = None
+    for cmd in (copy_cmd, encode_cmd):
+        if cmd is None:
+            continue
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+            return True
+        except subprocess.CalledProcessError as e:
+            last_error = e
+
+    print(f"[ERROR] Failed to split segment: {last_error}")
+    return False
+
+
+def _split_all_segments_single_pass(
+    input_file: Path,
+    output_dir: Path,
+    split_points: List[Tuple[float, float]],
+) -> bool:
+    """
+    Extract every split point with one ffmpeg segment-muxer invocation
+
+    A single sequential read of the input replaces N seeking ffmpeg
+    launches. Outputs land as part_000.wav, part_001.wav, ... in
+    split-point order (renamed/filtered by the caller).
+
+    Returns:
+        True if successful
+    """
+    if len(split_points) < 2:
+        return False  # segment muxer needs at least one interior cut
+
+    segment_times = ",".join(f"{end:.3f}" for _, end in split_points[:-1])
     cmd = [
         "ffmpeg",
+        "-hide_banner", "-nostats", "-loglevel", "error",
+        "-threads", str(FFMPEG_THREADS),
         "-i", str(input_file),
-        "-ss", str(start_time),
-        "-t", str(duration),
-        "-c", "copy",  # Copy codec (fast, no re-encoding)
-        "-y",  # Overwrite output
-        str(output_file)
+        "-f", "segment",
+        "-segment_times", segment_times,
+        "-reset_timestamps", "1",
+        "-c", "copy",
+        "-y",
+        str(output_dir / "part_%03d.wav")
     ]
-    
+
     try:
-        subprocess.run(cmd, capture_output=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"[ERROR] Failed to split segment: {e}")
+        print(f"[WARN] Single-pass split failed, falling back to per-segment extraction: {e}")
         return False
 
 
+async def _split_audio_segment_async(
+    input_file: Path,
+    output_file: Path,
+    start_time: float,
+    duration: float,
+    threads: Optional[int] = None
+) -> bool:
+    """Async twin of split_audio_segment (same commands, same fallback)"""
+    copy_cmd, encode_cmd = _split_segment_cmds(
+        input_file, output_file, start_time, duration, threads
+    )
+
+    for cmd in (copy_cmd, encode_cmd):
+        if cmd is None:
+            continue
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        await proc.communicate()
+        if proc.returncode == 0:
+            return True
+
+    print(f"[ERROR] Failed to split segment: {output_file.name}")
+    return False
+
+
+async def _extract_segments_async(
+    input_file: Path,
+    output_dir: Path,
+    to_extract: List[Tuple[int, float, float, int]],
+) -> List[Tuple[int, Optional[AudioSegment], str]]:
+    """
+    Extract the surviving segments as overlapping asyncio subprocesses
+
+    The event loop keeps up to cpu_count ffmpeg children in flight
+    without forking Python worker processes; progress is returned as
+    message strings so the caller prints them in order.
+    """
+    n_workers = os.cpu_count() or 1
+    worker_threads = max(1, (os.cpu_count() or 1) // n_workers)
+    semaphore = asyncio.Semaphore(n_workers)
+
+    async def extract_one(
+        start_time: float, end_time: float, segment_index: int
+    ) -> Tuple[int, Optional[AudioSegment], str]:
+        duration = end_time - start_time
+        label = f"Extracting segment {start_time:.1f}s - {end_time:.1f}s ({duration:.1f}s)..."
+
+        output_filename = f"segment_{segment_index:03d}.wav"
+        output_path = output_dir / output_filename
+
+        async with semaphore:
+            ok = await _split_audio_segment_async(
+                input_file, output_path, start_time, duration, worker_threads
+            )
+        if not ok:
+            return segment_index, None, f"{label} FAILED"
+
+        segment = AudioSegment(
+            filename=output_filename,
+            start_time=start_time,
+            end_time=end_time,
+            duration=duration,
+            segment_index=segment_index
+        )
+        return segment_index, segment, f"{label} OK"
+
+    return list(await asyncio.gather(*(
+        extract_one(start_time, end_time, index)
+        for _, start_time, end_time, index in to_extract
+    )))
+
+
 def process_audio_file(
     input_file: Path,
     output_dir: Path,
@@ -296,43 +730,71 @@ def process_audio_file(
     
     print(f"[INFO] Will create {len(split_points)} segments")
     
-    # Process each segment
-    segments_metadata = []
+    # Filter near-silent segments first: the ratio comes from intersecting
+    # the already-detected silences, so no extra ffmpeg pass is needed
+    to_extract: List[Tuple[int, float, float, int]] = []
     segment_index = 1
-    
-    for start_time, end_time in split_points:
+
+    for position, (start_time, end_time) in enumerate(split_points):
         duration = end_time - start_time
-        
-        # Check silence ratio
-        print(f"[{segment_index}/{len(split_points)}] Checking segment {start_time:.1f}s - {end_time:.1f}s ({duration:.1f}s)...", end='')
-        
-        silence_ratio = calculate_segment_silence_ratio(
-            input_file,
-            start_time,
-            duration,
-            noise_threshold_db=noise_threshold_db
-        )
-        
+        print(f"[{position + 1}/{len(split_points)}] Checking segment {start_time:.1f}s - {end_time:.1f}s ({duration:.1f}s)...", end='')
+
+        silence_ratio = calculate_segment_silence_ratio(silences, start_time, duration)
+
         if silence_ratio > silence_ratio_threshold:
             print(f" SKIP (silence: {silence_ratio*100:.0f}%)")
             continue
-        
+
         print(f" OK (silence: {silence_ratio*100:.0f}%)")
-        
-        # Generate output filename
-        output_filename = f"segment_{segment_index:03d}.wav"
-        output_path = output_dir / output_filename
-        
-        # Split segment
-        if split_audio_segment(input_file, output_path, start_time, duration):
+        to_extract.append((position, start_time, end_time, segment_index))
+        segment_index += 1
+
+    # Preferred path: cut every segment in one sequential pass over the
+    # input, then keep/rename only the audible ones
+    segments_metadata = []
+
+    if _split_all_segments_single_pass(input_file, output_dir, split_points):
+        kept = {position: (start, end, index) for position, start, end, index in to_extract}
+        # The muxer can produce fewer parts than split points when the
+        # probed duration over-estimates the real one (e.g. VBR mp3) and a
+        # cut lands past EOF; re-extract those positions individually
+        missing: List[Tuple[int, float, float, int]] = []
+        for position in range(len(split_points)):
+            part_file = output_dir / f"part_{position:03d}.wav"
+            if position not in kept:
+                part_file.unlink(missing_ok=True)
+                continue
+            start_time, end_time, index = kept[position]
+            if not part_file.exists():
+                print(f"[WARN] Segment muxer produced no {part_file.name}; re-extracting segment {index}")
+                missing.append((position, start_time, end_time, index))
+                continue
+            output_filename = f"segment_{index:03d}.wav"
+            part_file.rename(output_dir / output_filename)
             segments_metadata.append(AudioSegment(
                 filename=output_filename,
                 start_time=start_time,
                 end_time=end_time,
-                duration=duration,
-                segment_index=segment_index
+                duration=end_time - start_time,
+                segment_index=index
             ))
-            segment_index += 1
+        if missing:
+            results = asyncio.run(_extract_segments_async(input_file, output_dir, missing))
+            for index, segment, message in sorted(results, key=lambda result: result[0]):
+                print(f"[{index}/{len(to_extract)}] {message}")
+                if segment is not None:
+                    segments_metadata.append(segment)
+            segments_metadata.sort(key=lambda segment: segment.segment_index)
+    else:
+        # Fallback: extract the surviving segments concurrently, one
+        # ffmpeg child each, driven by the event loop
+        results = asyncio.run(_extract_segments_async(input_file, output_dir, to_extract))
+
+        results.sort(key=lambda result: result[0])
+        for index, segment, message in results:
+            print(f"[{index}/{len(to_extract)}] {message}")
+            if segment is not None:
+                segments_metadata.append(segment)
     
     print(f"[DONE] Created {len(segments_metadata)} segments (filtered {len(split_points) - len(segments_metadata)} silent segments)")
     
@@ -341,15 +803,24 @@ def process_audio_file(
 
 def save_metadata(segments: List[AudioSegment], output_file: Path, source_file: Path):
     """Save segment metadata to JSON file"""
-    metadata = {
-        "source_file": source_file.name,
-        "total_segments": len(segments),
-        "segments": [asdict(seg) for seg in segments]
-    }
-    
-    with output_file.open('w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
-    
+    if orjson is not None:
+        # orjson serializes the dataclasses natively (no asdict hop) and
+        # writes UTF-8 bytes directly
+        metadata = {
+            "source_file": source_file.name,
+            "total_segments": len(segments),
+            "segments": segments
+        }
+        output_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        metadata = {
+            "source_file": source_file.name,
+            "total_segments": len(segments),
+            "segments": [asdict(seg) for seg in segments]
+        }
+        with output_file.open('w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+
     print(f"[INFO] Metadata saved to: {output_file}")
 
 
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Offline unit tests for the audio preprocessing split logic."""
+
+from __future__ import annotations
+
+import math
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+from src.preprocessing.audio_splitter import (
+    SilenceSegment,
+    Silences,
+    _parse_silence_lines,
+    calculate_segment_silence_ratio,
+    calculate_split_points,
+    np,
+)
+
+if np is not None:
+    from src.preprocessing.audio_splitter import _detect_silences_wav
+
+
+class SilenceRatioTests(unittest.TestCase):
+    def test_no_silences_means_fully_audible(self) -> None:
+        self.assertEqual(
+            calculate_segment_silence_ratio(Silences([], []), 0.0, 60.0), 0.0
+        )
+
+    def test_silence_fully_inside_segment(self) -> None:
+        silences = Silences(start=[10.0], end=[16.0])
+        self.assertAlmostEqual(
+            calculate_segment_silence_ratio(silences, 0.0, 60.0), 0.1
+        )
+
+    def test_silence_clipped_to_segment_window(self) -> None:
+        silences = Silences(start=[0.0], end=[20.0])
+        # Segment covers 10s..40s, so only 10s of the silence overlaps.
+        self.assertAlmostEqual(
+            calculate_segment_silence_ratio(silences, 10.0, 30.0), 10.0 / 30.0
+        )
+
+    def test_silence_outside_segment_ignored(self) -> None:
+        silences = Silences(start=[100.0], end=[110.0])
+        self.assertEqual(calculate_segment_silence_ratio(silences, 0.0, 60.0), 0.0)
+
+    def test_fully_silent_segment(self) -> None:
+        silences = Silences(start=[0.0], end=[60.0])
+        self.assertAlmostEqual(
+            calculate_segment_silence_ratio(silences, 5.0, 30.0), 1.0
+        )
+
+    def test_zero_duration_segment(self) -> None:
+        silences = Silences(start=[0.0], end=[60.0])
+        self.assertEqual(calculate_segment_silence_ratio(silences, 5.0, 0.0), 0.0)
+
+
+class SilenceParserTests(unittest.TestCase):
+    def test_parses_start_end_pairs(self) -> None:
+        lines = [
+            "size=N/A time=00:00:10.00 bitrate=N/A speed= 200x",
+            "[silencedetect @ 0x7f8] silence_start: 12.345",
+            "[silencedetect @ 0x7f8] silence_end: 14.5 | silence_duration: 2.155",
+        ]
+        silences = _parse_silence_lines(lines)
+        self.assertEqual(len(silences.start), 1)
+        self.assertAlmostEqual(silences.start[0], 12.345)
+        self.assertAlmostEqual(silences.end[0], 14.5)
+        self.assertAlmostEqual(silences.segments()[0].duration, 2.155)
+
+    def test_ignores_end_without_start(self) -> None:
+        lines = ["[silencedetect @ 0x7f8] silence_end: 14.5 | silence_duration: 2.0"]
+        self.assertEqual(len(_parse_silence_lines(lines).start), 0)
+
+    def test_trailing_start_without_end_is_dropped(self) -> None:
+        lines = ["[silencedetect @ 0x7f8] silence_start: 59.0"]
+        self.assertEqual(len(_parse_silence_lines(lines).start), 0)
+
+    def test_non_silencedetect_lines_skipped(self) -> None:
+        lines = [
+            "Input #0, wav, from 'meeting.wav':",
+            "  Duration: 01:00:00.00, bitrate: 1536 kb/s",
+        ]
+        self.assertEqual(len(_parse_silence_lines(lines).start), 0)
+
+
+class SilencesContainerTests(unittest.TestCase):
+    def test_round_trip_through_segments(self) -> None:
+        silences = Silences.from_segments([SilenceSegment(start=1.0, end=3.0)])
+        segments = silences.segments()
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(segments[0].start, 1.0)
+        self.assertEqual(segments[0].end, 3.0)
+        self.assertEqual(segments[0].duration, 2.0)
+
+
+class SplitPointTests(unittest.TestCase):
+    def test_no_silences_splits_by_max_length(self) -> None:
+        points = calculate_split_points(Silences([], []), 250.0, max_segment_length=120.0)
+        self.assertEqual(points, [(0.0, 120.0), (120.0, 240.0), (240.0, 250.0)])
+
+    def test_splits_at_silence_midpoints(self) -> None:
+        silences = Silences(start=[40.0, 90.0], end=[42.0, 92.0])
+        points = calculate_split_points(silences, 120.0, min_segment_length=30.0)
+        self.assertEqual(points, [(0.0, 41.0), (41.0, 91.0), (91.0, 120.0)])
+
+    def test_short_gaps_are_not_split(self) -> None:
+        silences = Silences(start=[10.0], end=[12.0])
+        points = calculate_split_points(silences, 120.0, min_segment_length=30.0)
+        self.assertEqual(points, [(0.0, 120.0)])
+
+
+@unittest.skipIf(np is None, "NumPy not installed; WAV fast path inactive")
+class WavFastPathTests(unittest.TestCase):
+    @staticmethod
+    def _write_wav(path: Path, spans: list[tuple[float, bool]], rate: int = 8000) -> None:
+        """Write mono 16-bit WAV from (duration_seconds, is_tone) spans."""
+        frames = bytearray()
+        for duration, is_tone in spans:
+            for i in range(int(duration * rate)):
+                value = int(12000 * math.sin(2 * math.pi * 440 * i / rate)) if is_tone else 0
+                frames += struct.pack("<h", value)
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(bytes(frames))
+
+    def test_detects_silence_between_tones(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tone.wav"
+            self._write_wav(path, [(2.0, True), (3.0, False), (2.0, True)])
+
+            silences = _detect_silences_wav(path, -45.0, 1.0)
+
+            self.assertEqual(len(silences.start), 1)
+            self.assertAlmostEqual(float(silences.start[0]), 2.0, delta=0.1)
+            self.assertAlmostEqual(float(silences.end[0]), 5.0, delta=0.1)
+
+    def test_all_tone_has_no_silences(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tone.wav"
+            self._write_wav(path, [(2.0, True)])
+            self.assertEqual(len(_detect_silences_wav(path, -45.0, 1.0).start), 0)
+
+    def test_short_gaps_below_min_duration_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tone.wav"
+            self._write_wav(path, [(1.0, True), (0.5, False), (1.0, True)])
+            self.assertEqual(len(_detect_silences_wav(path, -45.0, 1.0).start), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()